@@ -4,8 +4,9 @@ from __future__ import annotations
 import os
 from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastapi import FastAPI, HTTPException, Query, UploadFile
@@ -16,13 +17,16 @@ from pydantic import BaseModel
 
 from chatvault.config import load_config, save_config
 from chatvault.db import Database
-from chatvault.embeddings import DEFAULT_DB_PATH, DEFAULT_CHROMA_DIR, EmbeddingEngine
-from chatvault.search import SearchEngine
-from chatvault.rag import RAGPipeline
+from chatvault.embeddings import DEFAULT_DB_PATH, DEFAULT_CHROMA_DIR
 from chatvault.export import ExportEngine
 from chatvault.connectors import get_connectors
 from chatvault.llm import get_available_backends, get_backend
 
+if TYPE_CHECKING:
+    from chatvault.embeddings import EmbeddingEngine
+    from chatvault.rag import RAGPipeline
+    from chatvault.search import SearchEngine
+
 # ---------------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------------
@@ -43,6 +47,8 @@ _active_backend: str = os.environ.get("CHATVAULT_LLM_BACKEND", "ollama")
 # ---------------------------------------------------------------------------
 # Lazy singletons
 # ---------------------------------------------------------------------------
+# Search, embedding and RAG modules are imported on first use so that the
+# setup wizard endpoints (upload, validate, config) don't pay their load cost.
 
 _db: Database | None = None
 _search: SearchEngine | None = None
@@ -59,6 +65,7 @@ def _get_db() -> Database:
 def _get_search() -> SearchEngine:
     global _search
     if _search is None:
+        from chatvault.search import SearchEngine
         _search = SearchEngine(db_path=DEFAULT_DB_PATH, chroma_dir=DEFAULT_CHROMA_DIR)
     return _search
 
@@ -66,11 +73,14 @@ def _get_search() -> SearchEngine:
 def _get_embeddings() -> EmbeddingEngine:
     global _embeddings
     if _embeddings is None:
-        _embeddings = EmbeddingEngine(db_path=DEFAULT_DB_PATH, chroma_dir=DEFAULT_CHROMA_DIR)
+        # Share the search engine's instance so re-embedding (which recreates
+        # collections) is visible to search and chat.
+        _embeddings = _get_search().engine
     return _embeddings
 
 
 def _get_rag() -> RAGPipeline:
+    from chatvault.rag import RAGPipeline
     return RAGPipeline(
         db_path=DEFAULT_DB_PATH,
         chroma_dir=DEFAULT_CHROMA_DIR,
@@ -129,6 +139,29 @@ def _recency_label(created_at: str | None) -> str:
         return "Unknown"
 
 
+def _dir_signature(data_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return (name, mtime_ns, size) for each file directly inside data_dir."""
+    try:
+        entries = [e for e in os.scandir(data_dir) if e.is_file()]
+        return tuple(sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries))
+    except OSError:
+        return ()
+
+
+@lru_cache(maxsize=8)
+def _detect_sources_cached(data_dir: str, signature: tuple) -> tuple[str, ...]:
+    return tuple(c.source_id for c in get_connectors() if c.detect(Path(data_dir)))
+
+
+def _detect_sources(data_dir: Path) -> tuple[str, ...]:
+    """Return source_ids of connectors that detect an export in data_dir.
+
+    Detection parses export files, so results are memoized until a file in
+    the directory is added, removed or modified.
+    """
+    return _detect_sources_cached(str(data_dir), _dir_signature(data_dir))
+
+
 def _enrich_conversation(conv: dict[str, Any]) -> dict[str, Any]:
     """Add recency_label to a conversation dict."""
     conv["recency_label"] = _recency_label(conv.get("created_at"))
@@ -314,6 +347,7 @@ def get_settings():
         available = get_available_backends()
         connectors = get_connectors()
         cfg = load_config()
+        detected = _detect_sources(Path("data"))
         return {
             "active_backend": _active_backend,
             "backend": _active_backend,
@@ -323,7 +357,7 @@ def get_settings():
                 {
                     "name": type(c).__name__,
                     "platform": c.source_name,
-                    "detected": c.detect(Path("data")),
+                    "detected": c.source_id in detected,
                 }
                 for c in connectors
             ],
@@ -396,10 +430,9 @@ async def upload_files(files: list[UploadFile]):
 def upload_validate():
     """Run connector detection on the data/ directory."""
     try:
-        connectors = get_connectors()
-        data_dir = Path("data")
-        for c in connectors:
-            if c.detect(data_dir):
+        detected = _detect_sources(Path("data"))
+        for c in get_connectors():
+            if c.source_id in detected:
                 return {"valid": True, "platform": c.source_name}
         return {"valid": False, "platform": None}
     except Exception as e:
@@ -1,11 +1,25 @@
 """Claude (Anthropic) platform connector for ChatVault."""
 import json
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # optional: parses large exports several times faster
+except ImportError:
+    orjson = None
 
 from chatvault.connectors.base import BaseConnector, IngestResult
 from chatvault.db import Database
 
 
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class ClaudeConnector(BaseConnector):
     """Connector for Anthropic Claude chat exports."""
 
@@ -18,8 +32,7 @@ class ClaudeConnector(BaseConnector):
         if not conv_file.exists():
             return False
         try:
-            with open(conv_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(conv_file)
             if isinstance(data, list) and len(data) > 0:
                 return "chat_messages" in data[0]
         except (json.JSONDecodeError, KeyError, IndexError):
@@ -36,15 +49,13 @@ class ClaudeConnector(BaseConnector):
 
         # --- Conversations ---
         conv_file = data_dir / "conversations.json"
-        with open(conv_file, "r", encoding="utf-8") as f:
-            conversations = json.load(f)
+        conversations = _load_json(conv_file)
 
         # --- Projects (load for cross-referencing) ---
         projects_map: dict[str, dict] = {}
         proj_file = data_dir / "projects.json"
         if proj_file.exists():
-            with open(proj_file, "r", encoding="utf-8") as f:
-                projects = json.load(f)
+            projects = _load_json(proj_file)
             extras["projects"] = len(projects)
             for proj in projects:
                 projects_map[proj.get("uuid", "")] = {
@@ -55,8 +66,7 @@ class ClaudeConnector(BaseConnector):
         # --- Memories ---
         mem_file = data_dir / "memories.json"
         if mem_file.exists():
-            with open(mem_file, "r", encoding="utf-8") as f:
-                memories = json.load(f)
+            memories = _load_json(mem_file)
             extras["memories"] = len(memories)
 
         # --- Ingest conversations and messages ---
@@ -86,6 +96,10 @@ class ClaudeConnector(BaseConnector):
             )
             conv_count += 1
 
+            # Messages are inserted in one batch per conversation; attachments
+            # reference them, so they are inserted afterwards.
+            msg_rows: list[tuple] = []
+            attachments: list[dict] = []
             messages = conv.get("chat_messages") or []
             for pos, msg in enumerate(messages):
                 msg_uuid = msg.get("uuid")
@@ -104,15 +118,10 @@ class ClaudeConnector(BaseConnector):
                 if msg.get("files"):
                     msg_meta["files"] = len(msg["files"])
 
-                db.upsert_message(
-                    uuid=msg_uuid,
-                    conversation_uuid=conv_uuid,
-                    position=pos,
-                    sender=sender,
-                    text=text,
-                    created_at=msg.get("created_at"),
-                    metadata=msg_meta if msg_meta else None,
-                )
+                msg_rows.append((
+                    msg_uuid, conv_uuid, pos, sender, text,
+                    msg.get("created_at"), msg_meta if msg_meta else None,
+                ))
                 msg_count += 1
 
                 # Extract attachments from content blocks
@@ -126,25 +135,29 @@ class ClaudeConnector(BaseConnector):
                         att_uuid = f"{msg_uuid}-att-{att_index}"
                         code_text = block.get("text") or block.get("code") or ""
                         language = block.get("language") or ""
-                        db.upsert_attachment(
-                            uuid=att_uuid,
-                            message_uuid=msg_uuid,
-                            type="code_block",
-                            content=code_text.encode("utf-8") if code_text else None,
-                            metadata={"language": language},
-                        )
+                        attachments.append({
+                            "uuid": att_uuid,
+                            "message_uuid": msg_uuid,
+                            "type": "code_block",
+                            "content": code_text.encode("utf-8") if code_text else None,
+                            "metadata": {"language": language},
+                        })
                         att_index += 1
                     elif block_type == "image":
                         att_uuid = f"{msg_uuid}-att-{att_index}"
-                        db.upsert_attachment(
-                            uuid=att_uuid,
-                            message_uuid=msg_uuid,
-                            type="image",
-                        )
+                        attachments.append({
+                            "uuid": att_uuid,
+                            "message_uuid": msg_uuid,
+                            "type": "image",
+                        })
                         att_index += 1
                 if att_index > 0:
                     extras["attachments"] = extras.get("attachments", 0) + att_index
 
+            db.upsert_messages_many(msg_rows)
+            for attachment in attachments:
+                db.upsert_attachment(**attachment)
+
         db.commit()
         return IngestResult(
             source_id=self.source_id,
@@ -1,8 +1,9 @@
 """Universal SQLite schema and database helpers for ChatVault."""
 import json
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 class Database:
@@ -10,10 +11,25 @@ class Database:
 
     def __init__(self, db_path: str | Path = "chatvault.db"):
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+        # A larger statement cache keeps hot upsert/query statements prepared
+        self.conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, timeout=10, cached_statements=1024,
+        )
         self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        self.conn.execute("PRAGMA foreign_keys=ON")
+        # Set while transaction() owns the open transaction; commit() defers to it
+        self._in_transaction_block = False
+        if str(db_path) != ":memory:":
+            # Journal and mmap settings only apply to disk-backed databases
+            self.conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA mmap_size=2147483648;
+            """)
+        self.conn.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA foreign_keys=ON;
+        """)
         self.init_schema()
 
     def init_schema(self) -> None:
@@ -111,7 +127,7 @@ class Database:
             "INSERT OR REPLACE INTO sources (id, name, file_path) VALUES (?, ?, ?)",
             (id, name, file_path),
         )
-        self.conn.commit()
+        self.commit()
 
     def upsert_conversation(
         self,
@@ -151,6 +167,22 @@ class Database:
              json.dumps(metadata or {})),
         )
 
+    def upsert_messages_many(
+        self,
+        rows: Iterable[tuple[str, str, int, str, str | None, str | None, dict[str, Any] | None]],
+    ) -> None:
+        """Insert or replace many message records with a single executemany.
+
+        Each row is (uuid, conversation_uuid, position, sender, text,
+        created_at, metadata), matching upsert_message's arguments.
+        """
+        self.conn.executemany(
+            """INSERT OR REPLACE INTO messages
+               (uuid, conversation_uuid, position, sender, text, created_at, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            ((*row[:6], json.dumps(row[6] or {})) for row in rows),
+        )
+
     def upsert_attachment(
         self,
         uuid: str,
@@ -175,7 +207,39 @@ class Database:
         return [dict(r) for r in rows]
 
     def commit(self) -> None:
-        """Commit the current transaction."""
+        """Commit the current transaction.
+
+        Inside a transaction() block this is a no-op; the block commits once
+        when it exits.
+        """
+        if not self._in_transaction_block:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one IMMEDIATE transaction (a single commit/fsync).
+
+        Commits on success and rolls back on error; write helpers called inside
+        the block do not commit on their own. If a transaction is already
+        open, the block joins it and leaves the commit to its owner.
+        """
+        if self.conn.in_transaction:
+            outer = self._in_transaction_block
+            self._in_transaction_block = True
+            try:
+                yield
+            finally:
+                self._in_transaction_block = outer
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._in_transaction_block = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction_block = False
         self.conn.commit()
 
     def rebuild_fts(self) -> None:
@@ -188,7 +252,9 @@ class Database:
             JOIN conversations c ON m.conversation_uuid = c.uuid
             WHERE m.text IS NOT NULL AND m.text != ''
         """)
-        self.conn.commit()
+        # Merge index segments left by the bulk reload into a single b-tree
+        self.conn.execute("INSERT INTO messages_fts(messages_fts) VALUES('optimize')")
+        self.commit()
 
     def get_all_conversations(self) -> list[dict[str, Any]]:
         """Return all conversations as a list of dicts."""
@@ -197,13 +263,16 @@ class Database:
         ).fetchall()
         return [dict(r) for r in rows]
 
-    def get_conversation_messages(self, conv_uuid: str) -> list[dict[str, Any]]:
-        """Return all messages for a conversation, ordered by position."""
-        rows = self.conn.execute(
+    def iter_conversation_messages(self, conv_uuid: str) -> Iterator[sqlite3.Row]:
+        """Yield messages for a conversation lazily, ordered by position."""
+        yield from self.conn.execute(
             "SELECT * FROM messages WHERE conversation_uuid = ? ORDER BY position",
             (conv_uuid,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        )
+
+    def get_conversation_messages(self, conv_uuid: str) -> list[dict[str, Any]]:
+        """Return all messages for a conversation, ordered by position."""
+        return [dict(r) for r in self.iter_conversation_messages(conv_uuid)]
 
     def get_message_count(self) -> int:
         """Return total message count."""
@@ -228,7 +297,7 @@ class Database:
 
     def create_tag(self, name: str) -> int:
         cur = self.conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (name,))
-        self.conn.commit()
+        self.commit()
         row = self.conn.execute("SELECT id FROM tags WHERE name = ?", (name,)).fetchone()
         return row["id"]
 
@@ -241,14 +310,14 @@ class Database:
             "INSERT OR IGNORE INTO conversation_tags (conversation_uuid, tag_id) VALUES (?, ?)",
             (conv_uuid, tag_id)
         )
-        self.conn.commit()
+        self.commit()
 
     def untag_conversation(self, conv_uuid: str, tag_id: int) -> None:
         self.conn.execute(
             "DELETE FROM conversation_tags WHERE conversation_uuid = ? AND tag_id = ?",
             (conv_uuid, tag_id)
         )
-        self.conn.commit()
+        self.commit()
 
     def get_conversation_tags(self, conv_uuid: str) -> list[dict[str, Any]]:
         rows = self.conn.execute(
@@ -265,7 +334,7 @@ class Database:
         self.conn.execute(
             "UPDATE conversations SET starred = ? WHERE uuid = ?", (new_val, conv_uuid)
         )
-        self.conn.commit()
+        self.commit()
         return bool(new_val)
 
     def get_starred_conversations(self) -> list[dict[str, Any]]:
@@ -287,7 +356,7 @@ class Database:
             "INSERT INTO feedback (query, answer, chunk_ids, rating) VALUES (?, ?, ?, ?)",
             (query, answer, json.dumps(chunk_ids or []), rating),
         )
-        self.conn.commit()
+        self.commit()
 
     def get_feedback_stats(self) -> dict[int, int]:
         """Return feedback counts grouped by rating."""
@@ -297,5 +366,11 @@ class Database:
         return {r["rating"]: r["count"] for r in rows}
 
     def close(self) -> None:
-        """Close the database connection."""
-        self.conn.close()
+        """Refresh query planner statistics and close the database connection."""
+        try:
+            self.conn.execute("PRAGMA analysis_limit=400")
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # statistics are best-effort; never block closing
+        finally:
+            self.conn.close()
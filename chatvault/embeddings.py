@@ -13,9 +13,6 @@ import time
 from pathlib import Path
 from typing import Any, Callable
 
-import chromadb
-from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
-
 from chatvault.db import Database
 
 # ---------------------------------------------------------------------------
@@ -29,6 +26,7 @@ MODEL_NAME = "all-MiniLM-L6-v2"
 MAX_CHUNK_CHARS = 1600
 CHUNK_OVERLAP = 200
 LONG_MESSAGE_THRESHOLD = 2000  # ~500 tokens * 4 chars
+PROGRESS_INTERVAL = 0.25  # seconds between progress reports
 
 
 # ---------------------------------------------------------------------------
@@ -45,17 +43,14 @@ def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS, overlap: int = CHUNK
 
     Returns:
         A list of text chunks. Returns a single-element list if text is short enough.
+        Chunks start every ``max_chars - overlap`` characters; a final chunk that
+        would lie entirely inside the previous chunk's overlap is not emitted.
     """
     if len(text) <= max_chars:
         return [text]
 
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = start + max_chars
-        chunks.append(text[start:end])
-        start += max_chars - overlap
-    return chunks
+    stride = max_chars - overlap
+    return [text[start:start + max_chars] for start in range(0, len(text) - overlap, stride)]
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +75,10 @@ class EmbeddingEngine:
         self.chroma_dir = Path(chroma_dir)
         self.chroma_dir.mkdir(parents=True, exist_ok=True)
 
+        # Imported here so chunk_text and the constants load without ChromaDB
+        import chromadb
+        from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+
         self._ef = SentenceTransformerEmbeddingFunction(model_name=MODEL_NAME)
         self._client = chromadb.PersistentClient(path=str(self.chroma_dir))
 
@@ -154,12 +153,16 @@ class EmbeddingEngine:
             if conv.get("summary"):
                 parts.append(conv["summary"])
 
-            # First two human messages
-            messages = self.db.get_conversation_messages(conv["uuid"])
-            human_msgs = [m for m in messages if m["sender"] == "human"]
-            for m in human_msgs[:2]:
-                if m.get("text"):
+            # First two human messages (stop reading once both are found)
+            human_seen = 0
+            for m in self.db.iter_conversation_messages(conv["uuid"]):
+                if m["sender"] != "human":
+                    continue
+                if m["text"]:
                     parts.append(m["text"][:800])  # cap each contribution
+                human_seen += 1
+                if human_seen == 2:
+                    break
 
             doc_text = "\n\n".join(parts).strip()
             if not doc_text:
@@ -206,9 +209,8 @@ class EmbeddingEngine:
         metadatas: list[dict[str, Any]] = []
 
         for row in rows:
-            row_d = dict(row)
-            text = row_d["text"]
-            base_id = f"msg-{row_d['uuid']}"
+            text = row["text"]
+            base_id = f"msg-{row['uuid']}"
 
             chunks = chunk_text(text)
             for i, chunk in enumerate(chunks):
@@ -219,12 +221,12 @@ class EmbeddingEngine:
                 ids.append(chunk_id)
                 documents.append(chunk)
                 metadatas.append({
-                    "conversation_uuid": row_d["conversation_uuid"],
-                    "message_uuid": row_d["uuid"],
-                    "sender": row_d["sender"],
-                    "date": row_d.get("created_at") or "",
-                    "conversation_name": row_d.get("conversation_name") or "",
-                    "source_id": row_d.get("source_id") or "",
+                    "conversation_uuid": row["conversation_uuid"],
+                    "message_uuid": row["uuid"],
+                    "sender": row["sender"],
+                    "date": row["created_at"] or "",
+                    "conversation_name": row["conversation_name"] or "",
+                    "source_id": row["source_id"] or "",
                 })
 
         if not ids:
@@ -235,12 +237,24 @@ class EmbeddingEngine:
         self._batch_add(self.msg_collection, ids, documents, metadatas, label="messages", progress_callback=progress_callback)
         return len(ids)
 
+    def embed_query(self, query_text: str) -> Any:
+        """Embed a query with the model shared by both collections.
+
+        Args:
+            query_text: The text to embed.
+
+        Returns:
+            The query's embedding vector, reusable via query_similar's query_embedding.
+        """
+        return self._ef([query_text])[0]
+
     def query_similar(
         self,
         query_text: str,
         collection: str = "message_chunks",
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        query_embedding: Any = None,
     ) -> dict[str, Any]:
         """Search for similar documents in a collection.
 
@@ -249,15 +263,18 @@ class EmbeddingEngine:
             collection: Which collection to query ('conversation_topics' or 'message_chunks').
             n_results: Number of results to return.
             where: Optional ChromaDB where filter dict.
+            query_embedding: Precomputed embedding of query_text (see embed_query);
+                when given, the text is not embedded again.
 
         Returns:
             Raw ChromaDB query result dict with ids, documents, metadatas, distances.
         """
         col = self.conv_collection if collection == "conversation_topics" else self.msg_collection
-        kwargs: dict[str, Any] = {
-            "query_texts": [query_text],
-            "n_results": n_results,
-        }
+        kwargs: dict[str, Any] = {"n_results": n_results}
+        if query_embedding is not None:
+            kwargs["query_embeddings"] = [query_embedding]
+        else:
+            kwargs["query_texts"] = [query_text]
         if where:
             kwargs["where"] = where
         return col.query(**kwargs)
@@ -287,9 +304,14 @@ class EmbeddingEngine:
         batch_size: int = 256,
         progress_callback: Callable[[int, int, str], None] | None = None,
     ) -> None:
-        """Add documents to a ChromaDB collection in batches with progress."""
+        """Add documents to a ChromaDB collection in batches with progress.
+
+        Progress is reported at most every PROGRESS_INTERVAL seconds (and
+        always for the final batch) so UI callbacks don't flood the client.
+        """
         total = len(ids)
-        t0 = time.time()
+        t0 = time.monotonic()
+        last_report = t0
         for start in range(0, total, batch_size):
             end = min(start + batch_size, total)
             collection.add(
@@ -297,11 +319,13 @@ class EmbeddingEngine:
                 documents=documents[start:end],
                 metadatas=metadatas[start:end],
             )
+            now = time.monotonic()
+            if end < total and now - last_report < PROGRESS_INTERVAL:
+                continue
+            last_report = now
             if progress_callback is not None:
                 progress_callback(end, total, label)
-            if end % 100 < batch_size or end == total:
-                elapsed = time.time() - t0
-                print(f"  [{label}] {end}/{total} embedded ({elapsed:.1f}s)")
+            print(f"  [{label}] {end}/{total} embedded ({now - t0:.1f}s)")
 
 
 # ---------------------------------------------------------------------------
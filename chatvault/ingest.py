@@ -1,5 +1,6 @@
 """Ingestion orchestrator for ChatVault."""
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -26,7 +27,6 @@ def main(data_dir: str | Path | None = None, force: bool = False) -> None:
             print("No data/ directory found. Pass a path as argument.")
             sys.exit(1)
 
-    import os
     db_path = os.environ.get("CHATVAULT_DB_PATH", "chatvault.db")
     db = Database(db_path)
 
@@ -43,7 +43,8 @@ def main(data_dir: str | Path | None = None, force: bool = False) -> None:
         for connector in connectors:
             if connector.detect(scan_dir):
                 print(f"Detected {connector.source_name} export in {scan_dir}")
-                result = connector.ingest(scan_dir, db)
+                with db.transaction():
+                    result = connector.ingest(scan_dir, db)
                 total_conv += result.conversations
                 total_msg += result.messages
                 extras_str = ", ".join(f"{k}: {v}" for k, v in result.extras.items())
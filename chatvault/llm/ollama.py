@@ -9,6 +9,9 @@ import requests
 
 from chatvault.llm.base import BaseLLM
 
+# Shared session so repeated probes and chats reuse keep-alive connections.
+_SESSION = requests.Session()
+
 
 # ---------------------------------------------------------------------------
 # Standalone helpers (usable without instantiating OllamaLLM)
@@ -24,7 +27,7 @@ def list_models(host: str = "http://localhost:11434") -> list[str]:
         List of model name strings, e.g. ["llama3:latest", "tinyllama:latest"].
     """
     try:
-        resp = requests.get(f"{host}/api/tags", timeout=5)
+        resp = _SESSION.get(f"{host}/api/tags", timeout=5)
         resp.raise_for_status()
         return [m["name"] for m in resp.json().get("models", [])]
     except requests.RequestException:
@@ -48,7 +51,7 @@ def pull_model(
     Yields:
         Progress dicts from the Ollama ``/api/pull`` streaming endpoint.
     """
-    resp = requests.post(
+    resp = _SESSION.post(
         f"{host}/api/pull",
         json={"name": model_name, "stream": True},
         stream=True,
@@ -68,11 +71,13 @@ class OllamaLLM(BaseLLM):
     def __init__(self) -> None:
         self.host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
         self.model = os.environ.get("OLLAMA_MODEL", "") or self._detect_model()
+        # Keep the model (and its prompt KV cache) loaded between chat turns
+        self.keep_alive = os.environ.get("OLLAMA_KEEP_ALIVE", "30m")
 
     def _detect_model(self) -> str:
         """Auto-detect first available Ollama model, fallback to 'llama3'."""
         try:
-            resp = requests.get(f"{self.host}/api/tags", timeout=5)
+            resp = _SESSION.get(f"{self.host}/api/tags", timeout=5)
             if resp.status_code == 200:
                 models = resp.json().get("models", [])
                 if models:
@@ -102,12 +107,13 @@ class OllamaLLM(BaseLLM):
             })
 
         try:
-            resp = requests.post(
+            resp = _SESSION.post(
                 f"{self.host}/api/chat",
                 json={
                     "model": self.model,
                     "messages": ollama_messages,
                     "stream": False,
+                    "keep_alive": self.keep_alive,
                 },
                 timeout=120,
             )
@@ -120,7 +126,7 @@ class OllamaLLM(BaseLLM):
     def is_available(self) -> bool:
         """Check if Ollama is running by hitting /api/tags."""
         try:
-            resp = requests.get(f"{self.host}/api/tags", timeout=5)
+            resp = _SESSION.get(f"{self.host}/api/tags", timeout=5)
             return resp.status_code == 200
         except requests.RequestException:
             return False
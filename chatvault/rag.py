@@ -47,12 +47,28 @@ class RAGPipeline:
             use_reranker: Whether to use cross-encoder reranking.
         """
         self.search = SearchEngine(db_path=db_path, chroma_dir=chroma_dir)
-        self.llm: BaseLLM = get_backend(llm_backend)
+        self._llm_backend_name = llm_backend
+        self._llm: BaseLLM | None = None
         self.reranker = None
         if use_reranker:
             from chatvault.reranker import Reranker
             self.reranker = Reranker()
 
+    @property
+    def llm(self) -> BaseLLM:
+        """The LLM backend, created on first access.
+
+        Search-only callers never touch it, so backend setup (e.g. Ollama
+        model detection) is skipped for them.
+        """
+        if self._llm is None:
+            self._llm = get_backend(self._llm_backend_name)
+        return self._llm
+
+    @llm.setter
+    def llm(self, backend: BaseLLM) -> None:
+        self._llm = backend
+
     def query(
         self,
         user_message: str,
@@ -1,23 +1,33 @@
 """Cross-encoder reranker for ChatVault search results."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from chatvault.search import SearchResult
 
 
+@lru_cache(maxsize=2)
+def _load_cross_encoder(model_name: str) -> Any:
+    """Load a CrossEncoder once per process, shared by all Reranker instances."""
+    from sentence_transformers import CrossEncoder
+    return CrossEncoder(model_name)
+
+
 class Reranker:
     """Lazy-loaded cross-encoder reranker using sentence-transformers."""
 
     MODEL_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    BATCH_SIZE = 32
+    # ~512 tokens, the model's max input; longer texts only add padding
+    MAX_TEXT_CHARS = 2048
 
     def __init__(self) -> None:
         self._model = None
 
     def _load_model(self) -> None:
         if self._model is None:
-            from sentence_transformers import CrossEncoder
-            self._model = CrossEncoder(self.MODEL_NAME)
+            self._model = _load_cross_encoder(self.MODEL_NAME)
 
     def rerank(
         self,
@@ -28,8 +38,11 @@ class Reranker:
         if not results:
             return []
         self._load_model()
-        pairs = [(query, r.text) for r in results]
-        scores = self._model.predict(pairs)
+        # Score all (query, text) pairs in batched forward passes
+        pairs = [(query, r.text[:self.MAX_TEXT_CHARS]) for r in results]
+        scores = self._model.predict(
+            pairs, batch_size=self.BATCH_SIZE, convert_to_numpy=True,
+        )
         scored = list(zip(results, scores))
         scored.sort(key=lambda x: x[1], reverse=True)
         reranked = []
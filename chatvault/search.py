@@ -1,17 +1,68 @@
 """Hybrid search engine for ChatVault — semantic + FTS5 keyword search."""
 from __future__ import annotations
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
 from pathlib import Path
+from sys import intern
 from typing import Any
 
 from chatvault.db import Database
 from chatvault.embeddings import EmbeddingEngine, DEFAULT_DB_PATH, DEFAULT_CHROMA_DIR
 
+# Shared pool for independent search legs (Chroma queries, FTS5). Tasks
+# submitted here never wait on other pool tasks, so it cannot deadlock.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chatvault-search")
 
-@dataclass
+# Reciprocal Rank Fusion constant and precomputed 1 / (k + rank) weights
+_RRF_K = 60
+_RRF_WEIGHTS: list[float] = [1.0 / (_RRF_K + rank) for rank in range(1, 4097)]
+
+
+# User-facing filter key -> ChromaDB condition builder, in clause order.
+# Date bounds stay separate conditions: Chroma allows one operator per field.
+_FILTER_BUILDERS: tuple[tuple[str, Any], ...] = (
+    ("source_id", lambda v: {"source_id": v}),
+    ("sender", lambda v: {"sender": v}),
+    ("date_from", lambda v: {"date": {"$gte": v}}),
+    ("date_to", lambda v: {"date": {"$lte": v}}),
+)
+
+
+def _rrf_weights(count: int) -> list[float]:
+    """Return RRF weights for ranks 1..count (table lookup when possible)."""
+    if count <= len(_RRF_WEIGHTS):
+        return _RRF_WEIGHTS
+    return [1.0 / (_RRF_K + rank) for rank in range(1, count + 1)]
+
+
+@lru_cache(maxsize=4)
+def _get_db(db_path: str) -> Database:
+    """Return a Database shared by all SearchEngines on the same path."""
+    return Database(db_path)
+
+
+@lru_cache(maxsize=4)
+def _get_engine(db_path: str, chroma_dir: str) -> EmbeddingEngine:
+    """Return an EmbeddingEngine shared by all SearchEngines on the same paths.
+
+    Construction loads the sentence-transformer model and opens ChromaDB,
+    which takes seconds, so it is done once per process.
+    """
+    return EmbeddingEngine(db_path=db_path, chroma_dir=chroma_dir)
+
+
+@dataclass(slots=True, eq=False)
 class SearchResult:
-    """A single search result."""
+    """A single search result.
+
+    Slotted to keep large candidate lists small; compared by identity, since
+    callers key results by UUID rather than by value.
+    """
 
     conversation_uuid: str
     message_uuid: str
@@ -37,8 +88,8 @@ class SearchEngine:
             db_path: Path to the ChatVault SQLite database.
             chroma_dir: Directory for ChromaDB persistent storage.
         """
-        self.db = Database(db_path)
-        self.engine = EmbeddingEngine(db_path=db_path, chroma_dir=chroma_dir)
+        self.db = _get_db(str(db_path))
+        self.engine = _get_engine(str(db_path), str(chroma_dir))
 
     # ------------------------------------------------------------------
     # Semantic search
@@ -62,13 +113,19 @@ class SearchEngine:
         """
         where = self._build_chroma_where(filters) if filters else None
 
-        # Query both collections
-        msg_results = self.engine.query_similar(
+        # Embed once on this thread (the tokenizer is not thread-safe), then
+        # run the two ANN lookups concurrently with the shared vector
+        embedding = self.engine.embed_query(query)
+        msg_future = _EXECUTOR.submit(
+            self.engine.query_similar,
             query, collection="message_chunks", n_results=n, where=where,
+            query_embedding=embedding,
         )
         conv_results = self.engine.query_similar(
             query, collection="conversation_topics", n_results=n, where=where,
+            query_embedding=embedding,
         )
+        msg_results = msg_future.result()
 
         results: list[SearchResult] = []
         results.extend(self._parse_chroma_results(msg_results))
@@ -97,47 +154,54 @@ class SearchEngine:
             n: Maximum number of results to return.
 
         Returns:
-            List of SearchResult sorted by FTS5 rank.
+            List of SearchResult sorted by BM25 relevance.
         """
-        # Build FTS5 query scoped to the text column only
+        # Build one FTS5 OR-query under a single column filter so only the
+        # message text is matched (the table also indexes conversation_name
+        # and summary). Matches are ranked by bm25() and limited inside the
+        # CTE so the planner keeps the FTS5 index path and only the top n
+        # rows are joined back to messages/conversations.
         words = [word for word in query.split() if word.strip()]
-        fts_query = " OR ".join(f"text:{word}" for word in words)
-        if not fts_query:
+        if not words:
             return []
+        fts_query = f"text : ({' OR '.join(words)})"
 
         try:
             rows = self.db.conn.execute(
                 """
+                WITH fts_matches AS (
+                    SELECT rowid, bm25(messages_fts) AS score FROM messages_fts
+                    WHERE messages_fts MATCH ?
+                    ORDER BY score
+                    LIMIT ?
+                )
                 SELECT m.uuid AS message_uuid, m.conversation_uuid,
                        m.sender, m.text, m.created_at,
                        c.name AS conversation_name, c.source_id,
-                       rank
-                FROM messages_fts
-                JOIN messages m ON m.rowid = messages_fts.rowid
+                       fm.score
+                FROM fts_matches fm
+                JOIN messages m ON m.rowid = fm.rowid
                 JOIN conversations c ON m.conversation_uuid = c.uuid
-                WHERE messages_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
+                ORDER BY fm.score
                 """,
                 (fts_query, n),
             ).fetchall()
         except Exception:
             return []
 
-        results: list[SearchResult] = []
-        for row in rows:
-            d = dict(row)
-            results.append(SearchResult(
-                conversation_uuid=d["conversation_uuid"],
-                message_uuid=d["message_uuid"],
-                conversation_name=d.get("conversation_name") or "",
-                text=d.get("text") or "",
+        return [
+            SearchResult(
+                conversation_uuid=row["conversation_uuid"],
+                message_uuid=row["message_uuid"],
+                conversation_name=row["conversation_name"] or "",
+                text=row["text"] or "",
                 score=0.0,  # FTS rank is used for ordering only; RRF assigns final score
-                source_id=d.get("source_id") or "",
-                sender=d.get("sender") or "",
-                created_at=d.get("created_at") or "",
-            ))
-        return results
+                source_id=intern(row["source_id"] or ""),
+                sender=intern(row["sender"] or ""),
+                created_at=row["created_at"] or "",
+            )
+            for row in rows
+        ]
 
     # ------------------------------------------------------------------
     # Hybrid search (RRF)
@@ -161,31 +225,28 @@ class SearchEngine:
         Returns:
             List of SearchResult sorted by RRF score (descending).
         """
-        k = 60
+        # FTS5 runs on the pool while semantic search (which fans out its own
+        # Chroma queries) runs on the calling thread.
+        keyword_future = _EXECUTOR.submit(self.keyword_search, query, n=n * 2)
         semantic_results = self.semantic_search(query, n=n * 2, filters=filters)
-        keyword_results = self.keyword_search(query, n=n * 2)
-
-        # Build RRF scores keyed by (conversation_uuid, message_uuid)
-        scores: dict[str, float] = {}
-        result_map: dict[str, SearchResult] = {}
-
-        for rank, r in enumerate(semantic_results, start=1):
-            key = r.message_uuid or r.conversation_uuid
-            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
-            result_map[key] = r
-
-        for rank, r in enumerate(keyword_results, start=1):
-            key = r.message_uuid or r.conversation_uuid
-            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
-            if key not in result_map:
-                result_map[key] = r
-
-        # Sort by RRF score descending
-        sorted_keys = sorted(scores, key=lambda x: scores[x], reverse=True)
+        keyword_results = keyword_future.result()
+
+        # Accumulate RRF scores in one pass; each entry is [score, result],
+        # keeping the first result object seen for a key (semantic first).
+        acc: dict[str, list[Any]] = {}
+        for ranked in (semantic_results, keyword_results):
+            for weight, r in zip(_rrf_weights(len(ranked)), ranked):
+                key = r.message_uuid or r.conversation_uuid
+                entry = acc.get(key)
+                if entry is None:
+                    acc[key] = [weight, r]
+                else:
+                    entry[0] += weight
+
+        # Select the top n by RRF score descending
         final: list[SearchResult] = []
-        for key in sorted_keys[:n]:
-            r = result_map[key]
-            r.score = scores[key]
+        for score, r in heapq.nlargest(n, acc.values(), key=itemgetter(0)):
+            r.score = score
             final.append(r)
 
         return final
@@ -201,7 +262,19 @@ class SearchEngine:
         filters: dict[str, Any] | None = None,
         reranker: Any = None,
     ) -> list[SearchResult]:
-        """Hybrid search with optional cross-encoder reranking."""
+        """Hybrid search with optional cross-encoder reranking.
+
+        Args:
+            query: The search query text.
+            n: Maximum number of results to return.
+            filters: Optional filter dict.
+            reranker: Object with ``rerank(query, candidates, top_k)`` that
+                scores all candidates in one batched call and returns the
+                top_k best (see chatvault.reranker.Reranker).
+
+        Returns:
+            List of SearchResult, reranked when a reranker is given.
+        """
         candidates = self.hybrid_search(query, n=n * 4, filters=filters)
         if reranker is not None:
             return reranker.rerank(query, candidates, top_k=n)
@@ -229,15 +302,7 @@ class SearchEngine:
     @staticmethod
     def _build_chroma_where(filters: dict[str, Any]) -> dict[str, Any] | None:
         """Convert user-facing filters to a ChromaDB where clause."""
-        conditions: list[dict[str, Any]] = []
-        if "source_id" in filters:
-            conditions.append({"source_id": filters["source_id"]})
-        if "sender" in filters:
-            conditions.append({"sender": filters["sender"]})
-        if "date_from" in filters:
-            conditions.append({"date": {"$gte": filters["date_from"]}})
-        if "date_to" in filters:
-            conditions.append({"date": {"$lte": filters["date_to"]}})
+        conditions = [build(filters[key]) for key, build in _FILTER_BUILDERS if key in filters]
 
         if not conditions:
             return None
@@ -248,28 +313,31 @@ class SearchEngine:
     @staticmethod
     def _parse_chroma_results(raw: dict[str, Any]) -> list[SearchResult]:
         """Convert raw ChromaDB query results into SearchResult objects."""
-        results: list[SearchResult] = []
         if not raw or not raw.get("ids") or not raw["ids"][0]:
-            return results
+            return []
 
         ids = raw["ids"][0]
         documents = raw.get("documents", [[]])[0]
         metadatas = raw.get("metadatas", [[]])[0]
         distances = raw.get("distances", [[]])[0]
 
-        for i, doc_id in enumerate(ids):
-            meta = metadatas[i] if i < len(metadatas) else {}
-            distance = distances[i] if i < len(distances) else 1.0
-            text = documents[i] if i < len(documents) else ""
-
-            results.append(SearchResult(
+        # Pad shorter columns with defaults; ids determines the result count.
+        # Low-cardinality fields (sender, source_id) are interned.
+        return [
+            SearchResult(
                 conversation_uuid=meta.get("conversation_uuid", ""),
                 message_uuid=meta.get("message_uuid", doc_id),
                 conversation_name=meta.get("conversation_name", ""),
                 text=text,
                 score=distance,
-                source_id=meta.get("source_id", ""),
-                sender=meta.get("sender", ""),
+                source_id=intern(meta.get("source_id", "")),
+                sender=intern(meta.get("sender", "")),
                 created_at=meta.get("date", ""),
-            ))
-        return results
+            )
+            for doc_id, text, meta, distance in zip(
+                ids,
+                chain(documents, repeat("")),
+                chain(metadatas, repeat({})),
+                chain(distances, repeat(1.0)),
+            )
+        ]
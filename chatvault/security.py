@@ -5,13 +5,53 @@ Does not modify any existing files or modules.
 """
 from __future__ import annotations
 
+import mmap
+import os
 import platform
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 from urllib.parse import urlparse
 
 
+# ---------------------------------------------------------------------------
+# Filesystem walking
+# ---------------------------------------------------------------------------
+
+def _walk(
+    root: str,
+    suffixes: tuple[str, ...],
+    skip_dirs: frozenset[str] = frozenset(),
+    skip_hidden: bool = False,
+) -> Iterator[str]:
+    """Yield paths of files under root whose names end with one of suffixes.
+
+    Directories in skip_dirs (and dot-prefixed entries when skip_hidden is
+    set) are pruned without being descended into.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if skip_hidden and name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in skip_dirs:
+                        stack.append(entry.path)
+                elif name.endswith(suffixes):
+                    yield entry.path
+
+
 # ---------------------------------------------------------------------------
 # Cloud sync detection
 # ---------------------------------------------------------------------------
@@ -22,6 +62,7 @@ CLOUD_SYNC_MARKERS: dict[str, str] = {
     "Google Drive": "Google Drive",
     "OneDrive": "OneDrive",
 }
+_CLOUD_SYNC_RE = re.compile("|".join(re.escape(m) for m in CLOUD_SYNC_MARKERS.values()))
 
 
 def check_cloud_sync(project_dir: Path) -> list[str]:
@@ -31,6 +72,8 @@ def check_cloud_sync(project_dir: Path) -> list[str]:
     """
     warnings: list[str] = []
     resolved = str(project_dir.resolve())
+    if not _CLOUD_SYNC_RE.search(resolved):
+        return warnings
     for service, marker in CLOUD_SYNC_MARKERS.items():
         if marker in resolved:
             warnings.append(
@@ -67,9 +110,79 @@ def check_ollama_binding(host: str = "http://localhost:11434") -> list[str]:
 # API key safety
 # ---------------------------------------------------------------------------
 
+# Matched against raw bytes so files never need UTF-8 decoding
 _API_KEY_PATTERN = re.compile(
-    r"""(?:ANTHROPIC_API_KEY|OPENAI_API_KEY)\s*=\s*['"]?sk-[A-Za-z0-9_-]{10,}""",
+    rb"""(?:ANTHROPIC_API_KEY|OPENAI_API_KEY)\s*=\s*['"]?sk-[A-Za-z0-9_-]{10,}""",
 )
+_SCAN_SUFFIXES = (".py", ".yaml", ".yml", ".toml", ".cfg", ".ini")
+_SCAN_SKIP_DIRS = frozenset({"venv", "node_modules", "__pycache__"})
+# Shortest text the pattern can match; smaller files are skipped unread
+_SCAN_MIN_SIZE = len(b"OPENAI_API_KEY=sk-") + 10
+# Larger files are mapped rather than copied into memory
+_SCAN_MMAP_SIZE = 64 * 1024
+
+
+def _contains_api_key(data: bytes | mmap.mmap) -> bool:
+    """Return True if data (bytes or an mmap) holds a hardcoded API key."""
+    # Cheap literal prefilter: most files contain neither marker
+    if data.find(b"sk-") == -1 or (
+        data.find(b"ANTHROPIC_API_KEY") == -1 and data.find(b"OPENAI_API_KEY") == -1
+    ):
+        return False
+    return _API_KEY_PATTERN.search(data) is not None
+
+
+def _file_has_api_key(filepath: str) -> bool:
+    """Scan one file for a hardcoded API key, mapping it when large."""
+    try:
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _SCAN_MIN_SIZE:
+                return False
+            if size < _SCAN_MMAP_SIZE:
+                return _contains_api_key(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _contains_api_key(mm)
+    except (OSError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=32)
+def _gitignore_rules(path: str, mtime_ns: int) -> tuple[tuple[str, bool, bool], ...]:
+    """Parse a .gitignore into (pattern, negated, dir_only) rules.
+
+    Keyed on mtime so an edited file is re-parsed on the next audit.
+    """
+    rules: list[tuple[str, bool, bool]] = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/")
+            if line.startswith("**/"):
+                line = line[3:]
+            if line:
+                rules.append((line, negated, dir_only))
+    return tuple(rules)
+
+
+def _gitignore_ignores(gitignore: Path, name: str) -> bool:
+    """Return True if gitignore ignores the top-level file called name.
+
+    Follows git's rules for a root-level file: last matching pattern wins,
+    "!" re-includes, and directory-only patterns never match a file.
+    """
+    rules = _gitignore_rules(str(gitignore), gitignore.stat().st_mtime_ns)
+    ignored = False
+    for pattern, negated, dir_only in rules:
+        if not dir_only and fnmatchcase(name, pattern):
+            ignored = not negated
+    return ignored
 
 
 def check_api_key_safety(project_dir: Path) -> list[str]:
@@ -85,8 +198,7 @@ def check_api_key_safety(project_dir: Path) -> list[str]:
     if env_file.exists():
         gitignore = resolved / ".gitignore"
         if gitignore.exists():
-            content = gitignore.read_text(encoding="utf-8", errors="replace")
-            if ".env" not in content:
+            if not _gitignore_ignores(gitignore, ".env"):
                 warnings.append(
                     ".env file exists but is not listed in .gitignore. "
                     "API keys could be committed to version control."
@@ -97,23 +209,14 @@ def check_api_key_safety(project_dir: Path) -> list[str]:
                 "API keys could be committed to version control."
             )
 
-    # Scan source files for hardcoded keys
-    for ext in ("*.py", "*.yaml", "*.yml", "*.toml", "*.cfg", "*.ini"):
-        for filepath in resolved.rglob(ext):
-            # Skip virtualenvs and hidden dirs
-            parts = filepath.parts
-            if any(p.startswith(".") or p in ("venv", ".venv", "node_modules", "__pycache__") for p in parts):
-                continue
-            try:
-                text = filepath.read_text(encoding="utf-8", errors="replace")
-            except OSError:
-                continue
-            if _API_KEY_PATTERN.search(text):
-                rel = filepath.relative_to(resolved)
-                warnings.append(
-                    f"Possible hardcoded API key found in {rel}. "
-                    f"Use environment variables instead."
-                )
+    # Scan source files for hardcoded keys, pruning virtualenvs and hidden dirs
+    for filepath in _walk(str(resolved), _SCAN_SUFFIXES, _SCAN_SKIP_DIRS, skip_hidden=True):
+        if _file_has_api_key(filepath):
+            rel = os.path.relpath(filepath, resolved)
+            warnings.append(
+                f"Possible hardcoded API key found in {rel}. "
+                f"Use environment variables instead."
+            )
     return warnings
 
 
@@ -121,6 +224,21 @@ def check_api_key_safety(project_dir: Path) -> list[str]:
 # Disk encryption check (macOS)
 # ---------------------------------------------------------------------------
 
+_SYSTEM = platform.system()
+
+
+@lru_cache(maxsize=1)
+def _filevault_status() -> str:
+    """Return `fdesetup status` output, cached since it can't change mid-process."""
+    result = subprocess.run(
+        ["fdesetup", "status"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    return result.stdout.strip()
+
+
 def check_disk_encryption() -> list[str]:
     """Check if FileVault is enabled on macOS.
 
@@ -128,7 +246,7 @@ def check_disk_encryption() -> list[str]:
     returns an informational note.
     """
     warnings: list[str] = []
-    if platform.system() != "Darwin":
+    if _SYSTEM != "Darwin":
         warnings.append(
             "Disk encryption check is only supported on macOS. "
             "Please verify your disk encryption manually."
@@ -136,13 +254,7 @@ def check_disk_encryption() -> list[str]:
         return warnings
 
     try:
-        result = subprocess.run(
-            ["fdesetup", "status"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        output = result.stdout.strip()
+        output = _filevault_status()
         if "FileVault is Off" in output:
             warnings.append(
                 "FileVault is OFF. Your chat data is stored unencrypted on disk. "
@@ -161,6 +273,9 @@ def check_disk_encryption() -> list[str]:
 # Raw export cleanup suggestion
 # ---------------------------------------------------------------------------
 
+_CLEANUP_LIST_CAP = 20
+
+
 def suggest_cleanup(data_dir: Path) -> list[str]:
     """After ingestion, suggest secure deletion of raw export files.
 
@@ -171,17 +286,20 @@ def suggest_cleanup(data_dir: Path) -> list[str]:
     if not resolved.exists():
         return suggestions
 
-    json_files = list(resolved.rglob("*.json"))
+    # Only the first 20 paths are listed; the rest are just counted
+    found = _walk(str(resolved), (".json",))
+    json_files = list(islice(found, _CLEANUP_LIST_CAP))
+    total = len(json_files) + sum(1 for _ in found)
     if json_files:
         suggestions.append(
-            f"Found {len(json_files)} JSON export file(s) in {resolved}. "
+            f"Found {total} JSON export file(s) in {resolved}. "
             f"After verifying your import, consider securely deleting raw exports:"
         )
-        for f in json_files[:20]:  # Cap listing at 20
-            rel = f.relative_to(resolved)
+        for f in json_files:
+            rel = os.path.relpath(f, resolved)
             suggestions.append(f"  - {rel}")
-        if len(json_files) > 20:
-            suggestions.append(f"  ... and {len(json_files) - 20} more.")
+        if total > _CLEANUP_LIST_CAP:
+            suggestions.append(f"  ... and {total - _CLEANUP_LIST_CAP} more.")
         suggestions.append(
             "On macOS, use 'rm -P <file>' for secure deletion. "
             "On Linux, use 'shred -u <file>'."
@@ -200,13 +318,17 @@ def run_security_audit(project_dir: Path) -> dict[str, list[str]]:
     An empty list means the check passed with no issues.
     """
     data_dir = project_dir / "data"
-    return {
-        "cloud_sync": check_cloud_sync(project_dir),
-        "ollama_binding": check_ollama_binding(),
-        "api_key_safety": check_api_key_safety(project_dir),
-        "disk_encryption": check_disk_encryption(),
-        "raw_export_cleanup": suggest_cleanup(data_dir),
-    }
+    # Checks are independent; run them together so the file walks and the
+    # fdesetup subprocess overlap instead of adding up
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="chatvault-audit") as pool:
+        futures = {
+            "cloud_sync": pool.submit(check_cloud_sync, project_dir),
+            "ollama_binding": pool.submit(check_ollama_binding),
+            "api_key_safety": pool.submit(check_api_key_safety, project_dir),
+            "disk_encryption": pool.submit(check_disk_encryption),
+            "raw_export_cleanup": pool.submit(suggest_cleanup, data_dir),
+        }
+    return {name: future.result() for name, future in futures.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -116,16 +116,34 @@ SAMPLE_MEMORIES = [
 ]
 
 
+def _sample_rows() -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+    """Flatten SAMPLE_CONVERSATIONS into conversation and message table rows."""
+    conv_rows: list[tuple[Any, ...]] = []
+    msg_rows: list[tuple[Any, ...]] = []
+    for conv in SAMPLE_CONVERSATIONS:
+        conv_rows.append((
+            conv["uuid"], "claude", conv["name"], conv.get("summary"),
+            conv["created_at"], conv["updated_at"],
+        ))
+        for pos, msg in enumerate(conv["chat_messages"]):
+            text = "\n".join(b["text"] for b in msg["content"] if b["type"] == "text")
+            msg_rows.append((
+                msg["uuid"], conv["uuid"], pos, msg["sender"], text, msg["created_at"],
+            ))
+    return conv_rows, msg_rows
+
+
+_SAMPLE_CONV_ROWS, _SAMPLE_MSG_ROWS = _sample_rows()
+
+
 @pytest.fixture
 def tmp_dir(tmp_path: Path) -> Path:
     """Return a temporary directory for test data."""
     return tmp_path
 
 
-@pytest.fixture
-def claude_export_dir(tmp_path: Path) -> Path:
-    """Create a temporary directory with a minimal Claude export."""
-    export_dir = tmp_path / "export"
+def _write_claude_export(export_dir: Path) -> Path:
+    """Write the minimal Claude export files into export_dir."""
     export_dir.mkdir()
 
     (export_dir / "conversations.json").write_text(
@@ -141,23 +159,58 @@ def claude_export_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def db(tmp_path: Path) -> Generator[Database, None, None]:
-    """Create an in-memory-like SQLite Database in a temp file."""
-    db_path = tmp_path / "test.db"
-    database = Database(db_path)
+def claude_export_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory with a minimal Claude export."""
+    return _write_claude_export(tmp_path / "export")
+
+
+@pytest.fixture
+def db() -> Generator[Database, None, None]:
+    """Create an in-memory SQLite Database."""
+    database = Database(":memory:")
     yield database
     database.close()
 
 
-@pytest.fixture
-def populated_db(db: Database, claude_export_dir: Path) -> Database:
-    """Return a database populated with sample Claude export data."""
-    from chatvault.connectors.claude import ClaudeConnector
+@pytest.fixture(scope="session")
+def populated_db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Bulk-load the sample data once per session and snapshot it to a file.
+
+    Rows are inserted directly rather than through ClaudeConnector.ingest;
+    connector behaviour is covered by test_connectors.py.
+    """
+    base = tmp_path_factory.mktemp("populated")
+    database = Database(base / "build.db")
+    with database.transaction():
+        database.upsert_source("claude", "Anthropic Claude")
+        database.conn.executemany(
+            """INSERT INTO conversations
+               (uuid, source_id, name, summary, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            _SAMPLE_CONV_ROWS,
+        )
+        database.conn.executemany(
+            """INSERT INTO messages
+               (uuid, conversation_uuid, position, sender, text, created_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            _SAMPLE_MSG_ROWS,
+        )
+    database.rebuild_fts()
+    template = base / "template.db"
+    database.conn.execute("VACUUM INTO ?", (str(template),))
+    database.close()
+    return template
 
-    connector = ClaudeConnector()
-    connector.ingest(claude_export_dir, db)
-    db.rebuild_fts()
-    return db
+
+@pytest.fixture
+def populated_db(populated_db_template: Path) -> Generator[Database, None, None]:
+    """Return an in-memory copy of the database populated with sample Claude export data."""
+    database = Database(":memory:")
+    template = sqlite3.connect(str(populated_db_template))
+    template.backup(database.conn)
+    template.close()
+    yield database
+    database.close()
 
 
 class MockLLM:
@@ -171,3 +224,25 @@ class MockLLM:
 
     def is_available(self) -> bool:
         return True
+
+
+class StubSearchEngine:
+    """Plain stand-in for SearchEngine that returns canned results.
+
+    Cheaper than a MagicMock, which records every attribute access and call.
+    """
+
+    def __init__(self, results: list[Any] | None = None) -> None:
+        self.results = results or []
+
+    def hybrid_search(self, query: str, n: int = 10, **kwargs: Any) -> list[Any]:
+        return list(self.results[:n])
+
+    def semantic_search(self, query: str, n: int = 10, **kwargs: Any) -> list[Any]:
+        return list(self.results[:n])
+
+    def keyword_search(self, query: str, n: int = 10, **kwargs: Any) -> list[Any]:
+        return list(self.results[:n])
+
+    def reranked_search(self, query: str, n: int = 10, **kwargs: Any) -> list[Any]:
+        return list(self.results[:n])
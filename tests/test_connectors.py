@@ -63,14 +63,16 @@ class TestClaudeConnectorIngest:
         assert db.get_conversation_count() == 3
         assert db.get_message_count() == 10
 
-    def test_ingest_message_content(self, populated_db: Database) -> None:
-        messages = populated_db.get_conversation_messages("conv-aaa-111")
+    def test_ingest_message_content(self, db: Database, claude_export_dir: Path) -> None:
+        ClaudeConnector().ingest(claude_export_dir, db)
+        messages = db.get_conversation_messages("conv-aaa-111")
         assert len(messages) == 4
         assert messages[0]["sender"] == "human"
         assert "investment" in messages[0]["text"].lower()
 
-    def test_ingest_sender_normalization(self, populated_db: Database) -> None:
-        messages = populated_db.get_conversation_messages("conv-bbb-222")
+    def test_ingest_sender_normalization(self, db: Database, claude_export_dir: Path) -> None:
+        ClaudeConnector().ingest(claude_export_dir, db)
+        messages = db.get_conversation_messages("conv-bbb-222")
         senders = {m["sender"] for m in messages}
         assert senders == {"human", "assistant"}
 
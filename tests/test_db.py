@@ -16,6 +16,23 @@ class TestSchemaCreation:
         db.init_schema()
         db.init_schema()
 
+    def test_file_database_uses_wal(self, tmp_path: Path) -> None:
+        database = Database(tmp_path / "test.db")
+        assert database.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        database.close()
+
+    def test_close_discards_uncommitted_writes(self, tmp_path: Path) -> None:
+        database = Database(tmp_path / "test.db")
+        database.upsert_source("src", "Source")
+        database.conn.commit()
+        database.upsert_conversation("conv-1", "src", name="Uncommitted")
+        database.close()
+        database.close()  # closing twice is harmless
+
+        reopened = Database(tmp_path / "test.db")
+        assert reopened.conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] == 0
+        reopened.close()
+
     def test_tables_exist(self, db: Database) -> None:
         tables = db.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table'"
@@ -59,6 +76,12 @@ class TestInsertQuery:
         assert len(msgs) == 1
         assert msgs[0]["text"] == "Hello"
 
+    def test_iter_conversation_messages(self, populated_db: Database) -> None:
+        messages = populated_db.iter_conversation_messages("conv-aaa-111")
+        first = next(messages)
+        assert first["uuid"] == "msg-001"
+        assert [m["position"] for m in messages] == [1, 2, 3]
+
     def test_upsert_replaces(self, db: Database) -> None:
         db.upsert_source("s1", "Source")
         db.upsert_conversation(uuid="c1", source_id="s1", name="Old")
@@ -68,17 +91,68 @@ class TestInsertQuery:
         assert len(convs) == 1
         assert convs[0]["name"] == "New"
 
-    def test_message_ordering(self, db: Database) -> None:
+    def test_upsert_messages_many(self, db: Database) -> None:
         db.upsert_source("s1", "Source")
         db.upsert_conversation(uuid="c1", source_id="s1")
-        db.upsert_message(uuid="m2", conversation_uuid="c1", position=1, sender="assistant", text="Reply")
-        db.upsert_message(uuid="m1", conversation_uuid="c1", position=0, sender="human", text="Hi")
+        db.upsert_messages_many([
+            ("m1", "c1", 0, "human", "Hi", None, None),
+            ("m2", "c1", 1, "assistant", "Reply", "2025-01-01", {"files": 1}),
+        ])
         db.commit()
         msgs = db.get_conversation_messages("c1")
+        assert [m["uuid"] for m in msgs] == ["m1", "m2"]
+        assert msgs[1]["metadata"] == '{"files": 1}'
+
+    def test_message_ordering(self, db: Database) -> None:
+        db.upsert_source("s1", "Source")
+        with db.transaction():
+            db.upsert_conversation(uuid="c1", source_id="s1")
+            db.upsert_message(uuid="m2", conversation_uuid="c1", position=1, sender="assistant", text="Reply")
+            db.upsert_message(uuid="m1", conversation_uuid="c1", position=0, sender="human", text="Hi")
+        msgs = db.get_conversation_messages("c1")
         assert msgs[0]["position"] == 0
         assert msgs[1]["position"] == 1
 
 
+class TestTransaction:
+    """Tests for the transaction context manager."""
+
+    def test_commits_on_success(self, db: Database) -> None:
+        db.upsert_source("s1", "Source")
+        with db.transaction():
+            db.upsert_conversation(uuid="c1", source_id="s1")
+        assert not db.conn.in_transaction
+        assert db.get_conversation_count() == 1
+
+    def test_rolls_back_on_error(self, db: Database) -> None:
+        db.upsert_source("s1", "Source")
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.upsert_conversation(uuid="c1", source_id="s1")
+                raise RuntimeError("boom")
+        assert db.get_conversation_count() == 0
+
+    def test_write_helpers_do_not_commit_inside_block(self, db: Database) -> None:
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.upsert_source("s1", "Source")
+                db.commit()
+                raise RuntimeError("boom")
+        assert db.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 0
+
+    def test_joined_block_leaves_commit_to_owner(self, db: Database) -> None:
+        db.conn.execute("INSERT INTO sources (id, name) VALUES ('a', 'A')")
+        assert db.conn.in_transaction
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.upsert_source("b", "B")
+                db.commit()
+                raise RuntimeError("boom")
+        assert db.conn.in_transaction
+        db.conn.rollback()
+        assert db.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 0
+
+
 class TestCounts:
     """Tests for count helpers."""
 
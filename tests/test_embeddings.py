@@ -39,6 +39,13 @@ class TestChunkText:
             reconstructed += c[200:]  # skip overlap
         assert len(reconstructed) >= len(text)
 
+    def test_no_redundant_tail_chunk(self) -> None:
+        text = "x" * 2900
+        chunks = chunk_text(text, max_chars=1600, overlap=200)
+        # A third chunk at 2800 would lie entirely inside the second's overlap
+        assert len(chunks) == 2
+        assert len(chunks[1]) == 1500
+
     def test_empty_text(self) -> None:
         assert chunk_text("") == [""]
 
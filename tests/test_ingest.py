@@ -25,6 +25,17 @@ class TestIngestOrchestrator:
         assert db.get_message_count() == 10
         db.conn.close()
 
+    def test_ingest_builds_fts_index(self, claude_export_dir: Path, tmp_path: Path) -> None:
+        """FTS5 is populated once, after all connectors have run."""
+        db_path = tmp_path / "test.db"
+        db = Database(db_path)
+        db.close = MagicMock()
+        with patch("chatvault.ingest.Database", return_value=db):
+            ingest_main(data_dir=str(claude_export_dir))
+        row = db.conn.execute("SELECT COUNT(*) AS cnt FROM messages_fts").fetchone()
+        assert row["cnt"] == 10
+        db.conn.close()
+
     def test_ingest_force_mode(self, claude_export_dir: Path, tmp_path: Path) -> None:
         """Force mode should drop and recreate tables."""
         db_path = tmp_path / "test.db"
@@ -0,0 +1,29 @@
+"""Tests for LLM backend request payloads."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from chatvault.llm.ollama import OllamaLLM
+
+
+class TestOllamaPayload:
+    """Tests for the Ollama /api/chat request body."""
+
+    def _chat_payload(self) -> dict:
+        llm = OllamaLLM()
+        with patch("chatvault.llm.ollama._SESSION.post") as post:
+            post.return_value.json.return_value = {"message": {"content": "hi"}}
+            assert llm.generate("system", [{"role": "user", "content": "Hello"}]) == "hi"
+        return post.call_args.kwargs["json"]
+
+    def test_keep_alive_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OLLAMA_MODEL", "llama3")
+        monkeypatch.delenv("OLLAMA_KEEP_ALIVE", raising=False)
+        assert self._chat_payload()["keep_alive"] == "30m"
+
+    def test_keep_alive_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OLLAMA_MODEL", "llama3")
+        monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "-1")
+        assert self._chat_payload()["keep_alive"] == "-1"
@@ -1,13 +1,11 @@
 """Tests for RAG pipeline."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from chatvault.rag import RAGPipeline, RAGResponse, SYSTEM_PROMPT
 from chatvault.search import SearchResult
-from tests.conftest import MockLLM
+from tests.conftest import MockLLM, StubSearchEngine
 
 
 class TestRAGPipeline:
@@ -16,14 +14,14 @@ class TestRAGPipeline:
     def _make_pipeline(self) -> RAGPipeline:
         """Create a pipeline with mocked dependencies."""
         pipeline = RAGPipeline.__new__(RAGPipeline)
-        pipeline.search = MagicMock()
+        pipeline.search = StubSearchEngine()
         pipeline.llm = MockLLM()
         pipeline.reranker = None
         return pipeline
 
     def test_query_returns_rag_response(self) -> None:
         pipeline = self._make_pipeline()
-        pipeline.search.hybrid_search.return_value = [
+        pipeline.search.results = [
             SearchResult("c1", "m1", "Test Conv", "Some context text", 0.5,
                          created_at="2025-03-10"),
         ]
@@ -34,7 +32,7 @@ class TestRAGPipeline:
 
     def test_query_with_chat_history(self) -> None:
         pipeline = self._make_pipeline()
-        pipeline.search.hybrid_search.return_value = []
+        pipeline.search.results = []
         history = [
             {"role": "user", "content": "Hi"},
             {"role": "assistant", "content": "Hello!"},
@@ -64,6 +62,8 @@ class TestRAGPipeline:
         context = RAGPipeline._build_context(results)
         # Context should truncate text to 1500 chars
         assert len(context) < 5000
+        assert "x" * 1500 in context
+        assert "x" * 1501 not in context
 
     def test_system_prompt_content(self) -> None:
         assert "knowledge assistant" in SYSTEM_PROMPT
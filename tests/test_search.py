@@ -1,7 +1,7 @@
 """Tests for search module — keyword search and RRF logic."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -30,7 +30,7 @@ class TestKeywordSearch:
     def test_keyword_search_returns_results(self, populated_db) -> None:
         engine = SearchEngine.__new__(SearchEngine)
         engine.db = populated_db
-        engine.engine = MagicMock()
+        engine.engine = None
         results = engine.keyword_search("investment", n=5)
         assert len(results) > 0
         assert any("investment" in r.text.lower() for r in results)
@@ -38,18 +38,76 @@ class TestKeywordSearch:
     def test_keyword_search_empty_query(self, populated_db) -> None:
         engine = SearchEngine.__new__(SearchEngine)
         engine.db = populated_db
-        engine.engine = MagicMock()
+        engine.engine = None
         results = engine.keyword_search("", n=5)
         assert results == []
 
+    def test_keyword_search_multiple_words(self, populated_db) -> None:
+        engine = SearchEngine.__new__(SearchEngine)
+        engine.db = populated_db
+        engine.engine = None
+        results = engine.keyword_search("pasta pytest", n=5)
+        assert {r.message_uuid for r in results} >= {"msg-008", "msg-009"}
+
+    def test_keyword_search_respects_limit(self, populated_db) -> None:
+        engine = SearchEngine.__new__(SearchEngine)
+        engine.db = populated_db
+        engine.engine = None
+        results = engine.keyword_search("index funds python pasta", n=2)
+        assert len(results) == 2
+
+    def test_keyword_search_ignores_conversation_name(self, populated_db) -> None:
+        engine = SearchEngine.__new__(SearchEngine)
+        engine.db = populated_db
+        engine.engine = None
+        # "ideas" only appears in the conversation name "Recipe ideas"
+        assert engine.keyword_search("ideas", n=5) == []
+
     def test_keyword_search_no_match(self, populated_db) -> None:
         engine = SearchEngine.__new__(SearchEngine)
         engine.db = populated_db
-        engine.engine = MagicMock()
+        engine.engine = None
         results = engine.keyword_search("xyznonexistent", n=5)
         assert results == []
 
 
+class _RecordingEngine:
+    """EmbeddingEngine stand-in that records embed and query calls."""
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+        self.queries: list[dict] = []
+
+    def embed_query(self, query_text: str) -> list[float]:
+        self.embedded.append(query_text)
+        return [0.1, 0.2, 0.3]
+
+    def query_similar(self, query_text: str, **kwargs) -> dict:
+        self.queries.append(kwargs)
+        name = kwargs["collection"]
+        return {
+            "ids": [[f"{name}-1"]],
+            "documents": [["text"]],
+            "metadatas": [[{"conversation_uuid": name}]],
+            "distances": [[0.5]],
+        }
+
+
+class TestSemanticSearch:
+    """Tests for the ChromaDB semantic search leg."""
+
+    def test_embeds_query_once_for_both_collections(self) -> None:
+        engine = SearchEngine.__new__(SearchEngine)
+        engine.engine = _RecordingEngine()
+        results = engine.semantic_search("index funds", n=5)
+        assert engine.engine.embedded == ["index funds"]
+        assert sorted(q["collection"] for q in engine.engine.queries) == [
+            "conversation_topics", "message_chunks",
+        ]
+        assert all(q["query_embedding"] == [0.1, 0.2, 0.3] for q in engine.engine.queries)
+        assert len(results) == 2
+
+
 class TestRRFFusion:
     """Tests for Reciprocal Rank Fusion logic."""
 
@@ -123,6 +181,10 @@ class TestBuildChromaWhere:
         result = SearchEngine._build_chroma_where({"source_id": "claude"})
         assert result == {"source_id": "claude"}
 
+    def test_operator_filter_value(self) -> None:
+        result = SearchEngine._build_chroma_where({"source_id": {"$in": ["claude", "chatgpt"]}})
+        assert result == {"source_id": {"$in": ["claude", "chatgpt"]}}
+
     def test_multiple_filters(self) -> None:
         result = SearchEngine._build_chroma_where({
             "source_id": "claude",
@@ -1,6 +1,7 @@
 """Tests for security hardening module."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -68,12 +69,43 @@ class TestApiKeySafety:
         warnings = check_api_key_safety(tmp_path)
         assert any(".env" in w for w in warnings)
 
+    def test_env_gitignore_patterns(self, tmp_path: Path) -> None:
+        (tmp_path / ".env").write_text("ANTHROPIC_API_KEY=sk-test")
+        gitignore = tmp_path / ".gitignore"
+        cases = {
+            "# .env\n": False,
+            ".env.example\n": False,
+            ".env/\n": False,
+            ".env*\n": True,
+            "/.env\n": True,
+            "**/.env\n": True,
+            ".env\n!.env\n": False,
+        }
+        for i, (content, ignored) in enumerate(cases.items()):
+            gitignore.write_text(content)
+            os.utime(gitignore, ns=(0, i))  # distinct mtime forces a fresh parse
+            warnings = check_api_key_safety(tmp_path)
+            assert (warnings == []) is ignored, content
+
     def test_hardcoded_key_in_python(self, tmp_path: Path) -> None:
         py_file = tmp_path / "config.py"
         py_file.write_text('ANTHROPIC_API_KEY = "sk-ant-1234567890abcdef"')
         warnings = check_api_key_safety(tmp_path)
         assert any("hardcoded" in w.lower() for w in warnings)
 
+    def test_hardcoded_key_in_large_file(self, tmp_path: Path) -> None:
+        py_file = tmp_path / "generated.py"
+        py_file.write_text("# padding\n" * 10_000 + 'OPENAI_API_KEY = "sk-1234567890abcdef"\n')
+        warnings = check_api_key_safety(tmp_path)
+        assert any("generated.py" in w for w in warnings)
+
+    def test_skips_virtualenv_and_hidden_dirs(self, tmp_path: Path) -> None:
+        for d in ("venv", "node_modules", ".git"):
+            (tmp_path / d).mkdir()
+            (tmp_path / d / "settings.py").write_text('OPENAI_API_KEY = "sk-1234567890abcdef"')
+        warnings = check_api_key_safety(tmp_path)
+        assert warnings == []
+
     def test_no_env_no_gitignore(self, tmp_path: Path) -> None:
         warnings = check_api_key_safety(tmp_path)
         assert warnings == []